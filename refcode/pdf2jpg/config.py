@@ -3,16 +3,36 @@
 Handles loading and validation of settings from settings.json.
 """
 
+import codecs
+import functools
 import json
 import logging
+import logging.handlers
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
+try:
+    import orjson  # Optional: faster JSON parsing
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_CONSOLE_FMT = logging.Formatter(
+    "[%(asctime)s] %(levelname)s - %(message)s", datefmt="%H:%M:%S"
+)
+_FILE_FMT = logging.Formatter("%(asctime)s | %(levelname)-8s | %(name)s | %(message)s")
+_LOG_MAX_BYTES = 10 * 1024 * 1024  # Rotate log file at 10 MB
+_LOG_BACKUP_COUNT = 3
+
+# Logging config currently applied by setup_logging (None = not configured yet)
+_logging_config: tuple[Path | None] | None = None
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CropSettings:
     """Crop settings for image output.
     
@@ -37,7 +57,7 @@ class CropSettings:
             raise ValueError(f"vertical_start ({self.vertical_start}) must be less than vertical_end ({self.vertical_end})")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings loaded from settings.json."""
 
@@ -51,26 +71,47 @@ class Settings:
     skip_if_exists: bool = True
     max_pages_per_pdf: int = 0  # 0 = no limit
     fail_fast: bool = False
+    workers: int = 0  # 0 = ProcessPoolExecutor default (CPU count)
     log_file: Path | None = None
     crop: CropSettings = field(default_factory=CropSettings)
 
     def __post_init__(self) -> None:
         """Validate and convert path strings to Path objects."""
+        # Frozen dataclass: bypass __setattr__ for the one-time conversion
         if isinstance(self.input_folder, str):
-            self.input_folder = Path(self.input_folder)
+            object.__setattr__(self, "input_folder", Path(self.input_folder))
         if isinstance(self.output_folder, str):
-            self.output_folder = Path(self.output_folder)
+            object.__setattr__(self, "output_folder", Path(self.output_folder))
         if isinstance(self.log_file, str):
-            self.log_file = Path(self.log_file) if self.log_file else None
+            object.__setattr__(self, "log_file", Path(self.log_file) if self.log_file else None)
 
         # Validate dpi
         if not (72 <= self.dpi <= 1200):
-            logger.warning(f"DPI {self.dpi} is unusual. Recommended: 72-600.")
+            logger.warning("DPI %s is unusual. Recommended: 72-600.", self.dpi)
 
         # Validate jpg_quality
         if not (1 <= self.jpg_quality <= 100):
             raise ValueError(f"jpg_quality must be 1-100, got {self.jpg_quality}")
 
+        # Validate workers
+        if self.workers < 0:
+            raise ValueError(f"workers must be >= 0, got {self.workers}")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_settings_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse a settings file, memoized by path and modification time.
+
+    Args:
+        path_str: Path to settings.json.
+        mtime_ns: File modification time; a changed file misses the cache.
+
+    Returns:
+        Parsed JSON data. Treat as read-only, it is shared between calls.
+    """
+    # Strip a UTF-8 BOM (e.g. from Notepad) so orjson and json behave the same
+    return _json_loads(Path(path_str).read_bytes().removeprefix(codecs.BOM_UTF8))
+
 
 def load_settings(settings_path: Path | None = None) -> Settings:
     """Load settings from JSON file.
@@ -90,13 +131,14 @@ def load_settings(settings_path: Path | None = None) -> Settings:
         settings_path = Path("settings.json")
 
     if not settings_path.exists():
-        logger.warning(f"Settings file not found: {settings_path}. Using defaults.")
+        logger.warning("Settings file not found: %s. Using defaults.", settings_path)
         return Settings()
 
-    logger.info(f"Loading settings from: {settings_path}")
+    logger.info("Loading settings from: %s", settings_path)
 
-    with open(settings_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _parse_settings_cached(
+        str(settings_path), settings_path.stat().st_mtime_ns
+    )
 
     # Parse crop settings
     crop_data = data.get("crop", {})
@@ -120,6 +162,7 @@ def load_settings(settings_path: Path | None = None) -> Settings:
         skip_if_exists=data.get("skip_if_exists", True),
         max_pages_per_pdf=data.get("max_pages_per_pdf", 0),
         fail_fast=data.get("fail_fast", False),
+        workers=data.get("workers", 0),
         log_file=data.get("log_file"),
         crop=crop_settings,
     )
@@ -128,31 +171,44 @@ def load_settings(settings_path: Path | None = None) -> Settings:
 def setup_logging(settings: Settings) -> None:
     """Configure logging based on settings.
 
+    Safe to call repeatedly: returns early if the same configuration is
+    already active, otherwise closes the old handlers before replacing them.
+
     Args:
         settings: Application settings.
     """
-    handlers: list[logging.Handler] = []
+    global _logging_config
+
+    root = logging.getLogger()
+    config_key = (settings.log_file,)
+    if root.handlers and _logging_config == config_key:
+        return
+
+    # Close existing handlers so old log files are not left open
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_formatter = logging.Formatter(
-        "[%(asctime)s] %(levelname)s - %(message)s", datefmt="%H:%M:%S"
-    )
-    console_handler.setFormatter(console_formatter)
-    handlers.append(console_handler)
+    console_handler.setFormatter(_CONSOLE_FMT)
+    root.addHandler(console_handler)
 
     # File handler (if configured)
     if settings.log_file:
-        file_handler = logging.FileHandler(settings.log_file, encoding="utf-8")
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+        file_handler = logging.handlers.RotatingFileHandler(
+            settings.log_file,
+            maxBytes=_LOG_MAX_BYTES,
+            backupCount=_LOG_BACKUP_COUNT,
+            encoding="utf-8",
         )
-        file_handler.setFormatter(file_formatter)
-        handlers.append(file_handler)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(_FILE_FMT)
+        root.addHandler(file_handler)
 
     # Configure root logger
-    logging.basicConfig(level=logging.DEBUG, handlers=handlers, force=True)
+    root.setLevel(logging.DEBUG)
+    _logging_config = config_key
 
     logger.info("Logging configured.")
@@ -3,19 +3,30 @@
 Core logic for converting PDF files to JPG images using PyMuPDF.
 """
 
+from __future__ import annotations
+
+import concurrent.futures
 import logging
+import logging.handlers
+import multiprocessing
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import Callable, ClassVar, Iterator, Literal
 
 import pymupdf  # Use pymupdf instead of fitz to avoid namespace conflicts
 
+try:
+    from PIL import Image  # Only needed for the PIL crop fallback
+except ImportError:
+    Image = None
+
 from .config import Settings
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult:
     """Result of a single PDF conversion."""
 
@@ -28,7 +39,7 @@ class ConversionResult:
     output_files: list[Path] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Result of batch conversion."""
 
@@ -39,47 +50,97 @@ class BatchResult:
     skipped_count: int = 0
     results: list[ConversionResult] = field(default_factory=list)
 
+    # Counter attribute for each result status
+    _COUNTER_ATTR: ClassVar[dict[str, str]] = {
+        "success": "success_count",
+        "partial": "partial_count",
+        "failed": "failed_count",
+        "skipped": "skipped_count",
+    }
+
     def add(self, result: ConversionResult) -> None:
         """Add a conversion result to the batch."""
         self.results.append(result)
         self.total_files += 1
-        match result.status:
-            case "success":
-                self.success_count += 1
-            case "partial":
-                self.partial_count += 1
-            case "failed":
-                self.failed_count += 1
-            case "skipped":
-                self.skipped_count += 1
-
-
-def get_output_path(
-    pdf_path: Path, page_num: int, output_folder: Path, fmt: str = "jpg"
-) -> Path:
-    """Generate output file path for a PDF page.
+        attr = self._COUNTER_ATTR[result.status]
+        setattr(self, attr, getattr(self, attr) + 1)
+
+
+def get_output_name(stem: str, page_num: int, fmt: str = "jpg") -> str:
+    """Generate output file name for a PDF page.
 
     Args:
-        pdf_path: Source PDF file path.
+        stem: Source PDF file stem.
         page_num: Page number (0-indexed).
-        output_folder: Output directory.
         fmt: Output format extension.
 
     Returns:
-        Path for the output image file.
+        File name for the output image.
     """
-    stem = pdf_path.stem
     # Page number is 1-indexed in filename, zero-padded to 3 digits
-    filename = f"{stem}_{page_num + 1:03d}.{fmt}"
-    return output_folder / filename
+    return f"{stem}_{page_num + 1:03d}.{fmt}"
+
+
+def iter_pdf_files(folder: Path) -> Iterator[Path]:
+    """Yield PDF files in a folder as the directory is scanned.
+
+    Args:
+        folder: Directory to scan (non-recursive).
+
+    Yields:
+        Path of each file with a .pdf extension. Like glob("*.pdf"), the match
+        is case-sensitive on POSIX and case-insensitive on Windows, so two
+        PDFs that would write the same output names (a.pdf / a.PDF) can't
+        both be picked up.
+    """
+    with os.scandir(folder) as it:
+        for entry in it:
+            if os.path.normcase(entry.name).endswith(".pdf") and entry.is_file():
+                yield Path(entry.path)
+
+
+def list_existing_outputs(output_folder: Path) -> frozenset[str]:
+    """Snapshot the file names in the output folder with a single scan.
+
+    Args:
+        output_folder: Output directory.
+
+    Returns:
+        Set of file names, empty if the folder doesn't exist.
+    """
+    try:
+        with os.scandir(output_folder) as it:
+            return frozenset(entry.name for entry in it)
+    except FileNotFoundError:
+        return frozenset()
 
 
-def should_skip_pdf(pdf_path: Path, settings: Settings) -> bool:
+def group_outputs_by_stem(existing: frozenset[str]) -> dict[str, frozenset[str]]:
+    """Group output file names by the PDF stem they were rendered from.
+
+    Args:
+        existing: File names in the output folder (see get_output_name()).
+
+    Returns:
+        Mapping of PDF stem to that PDF's existing output names.
+    """
+    groups: dict[str, set[str]] = {}
+    for name in existing:
+        stem, sep, _ = name.rpartition("_")
+        if sep:
+            groups.setdefault(stem, set()).add(name)
+    return {stem: frozenset(names) for stem, names in groups.items()}
+
+
+def should_skip_pdf(
+    pdf_path: Path, settings: Settings, existing: frozenset[str]
+) -> bool:
     """Check if PDF should be skipped based on existing output files.
 
     Args:
         pdf_path: Source PDF file path.
         settings: Application settings.
+        existing: File names already in the output folder.
 
     Returns:
         True if all expected output files exist and skip_if_exists is enabled.
@@ -89,47 +150,103 @@ def should_skip_pdf(pdf_path: Path, settings: Settings) -> bool:
 
     # We need to check if ANY output file exists
     # Since we don't know page count without opening, check for at least page 1
-    first_page_path = get_output_path(pdf_path, 0, settings.output_folder, settings.format)
-    if first_page_path.exists():
-        logger.info(f"Skipping (output exists): {pdf_path.name}")
+    if get_output_name(pdf_path.stem, 0, settings.format) in existing:
+        logger.info("Skipping (output exists): %s", pdf_path.name)
         return True
 
     return False
 
 
-def convert_pdf(pdf_path: Path, settings: Settings) -> ConversionResult:
+def make_savers(
+    settings: Settings,
+) -> tuple[Callable[[pymupdf.Pixmap, Path], None], Callable[[Image.Image, Path], None]]:
+    """Build format-specific save functions once so the page loop doesn't branch.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        (save_pixmap, save_pil) callables taking the image and output path.
+    """
+    if settings.format == "png":
+
+        def save_pixmap(pix: pymupdf.Pixmap, path: Path) -> None:
+            pix.save(str(path))
+
+        def save_pil(img: Image.Image, path: Path) -> None:
+            img.save(str(path), "PNG")
+
+    else:
+        quality = settings.jpg_quality
+
+        def save_pixmap(pix: pymupdf.Pixmap, path: Path) -> None:
+            pix.save(str(path), jpg_quality=quality)
+
+        def save_pil(img: Image.Image, path: Path) -> None:
+            # Only used by the no-clip crop fallback; 4:2:0 subsampling without
+            # Huffman optimization encodes fastest
+            img.save(
+                str(path),
+                "JPEG",
+                quality=quality,
+                subsampling=2,
+                optimize=False,
+                progressive=False,
+            )
+
+    return save_pixmap, save_pil
+
+
+def _log_mupdf_warnings(pdf_path: Path) -> None:
+    """Write (and clear) MuPDF warnings collected for a PDF to the debug log."""
+    warnings = pymupdf.TOOLS.mupdf_warnings()
+    if warnings:
+        logger.debug("MuPDF warnings for %s:\n%s", pdf_path.name, warnings)
+
+
+def convert_pdf(
+    pdf_path: Path, settings: Settings, existing: frozenset[str] | None = None
+) -> ConversionResult:
     """Convert a single PDF file to JPG images.
 
     Args:
         pdf_path: Path to the PDF file.
         settings: Application settings.
+        existing: Existing output file names (at least this PDF's).
+            Scanned here if None.
 
     Returns:
         ConversionResult with status and details.
     """
     result = ConversionResult(pdf_path=pdf_path, status="success")
 
+    if existing is None:
+        existing = list_existing_outputs(settings.output_folder)
+
     # Check if should skip
-    if should_skip_pdf(pdf_path, settings):
+    if should_skip_pdf(pdf_path, settings, existing):
         result.status = "skipped"
         return result
 
+    pymupdf.TOOLS.reset_mupdf_warnings()
     try:
         doc = pymupdf.open(pdf_path)
     except pymupdf.FileDataError as e:
-        logger.error(f"Corrupt PDF: {pdf_path.name} - {e}")
+        _log_mupdf_warnings(pdf_path)
+        logger.error("Corrupt PDF: %s - %s", pdf_path.name, e)
         result.status = "failed"
         result.error_message = f"Corrupt PDF: {e}"
         return result
     except Exception as e:
-        logger.error(f"Failed to open: {pdf_path.name} - {e}")
+        _log_mupdf_warnings(pdf_path)
+        logger.error("Failed to open: %s - %s", pdf_path.name, e)
         result.status = "failed"
         result.error_message = str(e)
         return result
 
     # Check for encryption
     if doc.is_encrypted:
-        logger.warning(f"Encrypted PDF (skipping): {pdf_path.name}")
+        logger.warning("Encrypted PDF (skipping): %s", pdf_path.name)
         doc.close()
         result.status = "failed"
         result.error_message = "Password protected"
@@ -147,86 +264,200 @@ def convert_pdf(pdf_path: Path, settings: Settings) -> ConversionResult:
     max_pages = settings.max_pages_per_pdf if settings.max_pages_per_pdf > 0 else len(doc)
     pages_to_process = min(len(doc), max_pages)
 
+    # Crop ratios are loop-invariant, compute them once per PDF
+    if settings.crop.enabled:
+        hs = settings.crop.horizontal_start / 100
+        he = settings.crop.horizontal_end / 100
+        vs = settings.crop.vertical_start / 100
+        ve = settings.crop.vertical_end / 100
+        pil_mode = "L" if settings.colorspace == "gray" else "RGB"
+
+    # Format-specific save functions, bound once per PDF
+    save_pixmap, save_pil = make_savers(settings)
+
+    # Output naming is per-PDF constant
+    stem = pdf_path.stem
+    fmt = settings.format
+    out_dir_str = str(settings.output_folder) + os.sep
+    check_existing = not settings.overwrite
+
     for page_num in range(pages_to_process):
-        output_path = get_output_path(
-            pdf_path, page_num, settings.output_folder, settings.format
-        )
+        out_name = get_output_name(stem, page_num, fmt)
 
         # Check overwrite
-        if output_path.exists() and not settings.overwrite:
-            logger.debug(f"Skipping existing: {output_path.name}")
+        if check_existing and out_name in existing:
+            logger.debug("Skipping existing: %s", out_name)
             result.pages_converted += 1
-            result.output_files.append(output_path)
+            result.output_files.append(Path(out_dir_str + out_name))
             continue
 
+        output_path = Path(out_dir_str + out_name)
+
         try:
             page = doc.load_page(page_num)
             # Render with specified DPI (rotation is automatically handled by PyMuPDF)
             # alpha=False ensures white background for transparent content
-            pix = page.get_pixmap(dpi=settings.dpi, colorspace=cs, alpha=False)
-
-            # Apply crop if enabled
+            clipped = False
             if settings.crop.enabled:
+                # Rasterize only the crop region (page.rect is in PDF points)
+                pr = page.rect
+                clip = pymupdf.Rect(
+                    pr.x0 + pr.width * hs,
+                    pr.y0 + pr.height * vs,
+                    pr.x0 + pr.width * he,
+                    pr.y0 + pr.height * ve,
+                )
+                try:
+                    pix = page.get_pixmap(
+                        dpi=settings.dpi, colorspace=cs, alpha=False, clip=clip
+                    )
+                    clipped = True
+                    logger.debug("Clipped: %s", clip)
+                except TypeError:
+                    # PyMuPDF without clip support: fall back to PIL crop below
+                    pix = page.get_pixmap(dpi=settings.dpi, colorspace=cs, alpha=False)
+            else:
+                pix = page.get_pixmap(dpi=settings.dpi, colorspace=cs, alpha=False)
+
+            # Crop with PIL only if the clip render was unavailable
+            if settings.crop.enabled and not clipped:
+                if Image is None:
+                    raise RuntimeError("Pillow is required to crop without clip support")
                 width = pix.width
                 height = pix.height
-                x0 = int(width * settings.crop.horizontal_start / 100)
-                x1 = int(width * settings.crop.horizontal_end / 100)
-                y0 = int(height * settings.crop.vertical_start / 100)
-                y1 = int(height * settings.crop.vertical_end / 100)
+                x0 = int(width * hs)
+                x1 = int(width * he)
+                y0 = int(height * vs)
+                y1 = int(height * ve)
                 
                 # Use PIL for cropping (more reliable)
-                from PIL import Image
-                import io
-                img_data = pix.tobytes("ppm")
-                img = Image.open(io.BytesIO(img_data))
+                # Build the image straight from the raw samples (no PPM round-trip)
+                img = Image.frombytes(pil_mode, (width, height), pix.samples)
                 img_cropped = img.crop((x0, y0, x1, y1))
-                if settings.format == "png":
-                    img_cropped.save(str(output_path), "PNG")
-                else:
-                    img_cropped.save(str(output_path), "JPEG", quality=settings.jpg_quality)
-                logger.debug(f"Cropped: ({x0},{y0}) to ({x1},{y1})")
+                save_pil(img_cropped, output_path)
+                logger.debug("Cropped: (%d,%d) to (%d,%d)", x0, y0, x1, y1)
                 
                 result.pages_converted += 1
                 result.output_files.append(output_path)
-                logger.debug(f"Converted: {output_path.name}")
+                logger.debug("Converted: %s", out_name)
                 continue
 
             # Save with format-specific options
-            if settings.format == "png":
-                pix.save(str(output_path))
-            else:
-                pix.save(str(output_path), jpg_quality=settings.jpg_quality)
+            save_pixmap(pix, output_path)
 
             result.pages_converted += 1
             result.output_files.append(output_path)
-            logger.debug(f"Converted: {output_path.name}")
+            logger.debug("Converted: %s", out_name)
 
         except Exception as e:
-            logger.error(f"Page {page_num + 1} failed in {pdf_path.name}: {e}")
+            logger.error("Page %d failed in %s: %s", page_num + 1, pdf_path.name, e)
             result.pages_failed += 1
 
     doc.close()
+    _log_mupdf_warnings(pdf_path)
 
     # Determine final status
     if result.pages_failed == 0:
         result.status = "success"
         logger.info(
-            f"✓ {pdf_path.name}: {result.pages_converted}/{result.pages_total} pages"
+            "✓ %s: %d/%d pages", pdf_path.name, result.pages_converted, result.pages_total
         )
     elif result.pages_converted > 0:
         result.status = "partial"
         logger.warning(
-            f"⚠ {pdf_path.name}: {result.pages_converted}/{result.pages_total} pages "
-            f"({result.pages_failed} failed)"
+            "⚠ %s: %d/%d pages (%d failed)",
+            pdf_path.name,
+            result.pages_converted,
+            result.pages_total,
+            result.pages_failed,
         )
     else:
         result.status = "failed"
         result.error_message = "All pages failed to render"
-        logger.error(f"✗ {pdf_path.name}: All pages failed")
+        logger.error("✗ %s: All pages failed", pdf_path.name)
 
     return result
 
 
+class _LoggerDispatchListener(logging.handlers.QueueListener):
+    """QueueListener that hands each record to its named logger in the parent.
+
+    Unlike a fixed handler list, this follows the parent's logging config at
+    the time the record arrives, including logging.lastResort when no
+    handlers are configured.
+    """
+
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        logging.getLogger(record.name).handle(record)
+
+
+def _worker_log_level() -> int:
+    """Lowest level the parent would actually emit for this module's records.
+
+    Workers use it as their root level, so records no handler would write
+    (e.g. per-page DEBUG with only the INFO console) are never created,
+    formatted or sent over the queue.
+    """
+    handler_levels: list[int] = []
+    current: logging.Logger | None = logger
+    while current is not None:
+        handler_levels.extend(handler.level for handler in current.handlers)
+        if not current.propagate:
+            break
+        current = current.parent
+    if not handler_levels:
+        handler_levels.append(
+            logging.lastResort.level if logging.lastResort else logging.WARNING
+        )
+    return max(logger.getEffectiveLevel(), min(handler_levels))
+
+
+def _init_worker(log_queue: multiprocessing.Queue, log_level: int) -> None:
+    """Process pool initializer: send worker log records to the parent.
+
+    Only the parent process writes to the console/log file, so this works
+    the same under fork and spawn. MuPDF's own stderr output is turned off
+    in workers only; its warnings are written to the debug log per PDF.
+
+    Args:
+        log_queue: Queue drained by the parent's listener.
+        log_level: Lowest level the parent emits (see _worker_log_level()).
+    """
+    root = logging.getLogger()
+    # Handlers inherited under fork still share the parent's streams; drop
+    # them without closing so buffered parent output isn't flushed twice.
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(log_level)
+    pymupdf.TOOLS.mupdf_display_errors(False)
+
+
+def _future_result(
+    future: concurrent.futures.Future, pdf_path: Path
+) -> ConversionResult:
+    """Get a worker's result; a crashed or failing worker becomes a failed result.
+
+    Args:
+        future: Future returned by executor.submit(convert_pdf, ...).
+        pdf_path: PDF the future is converting.
+
+    Returns:
+        The worker's ConversionResult, or a failed one for that PDF.
+    """
+    try:
+        return future.result()
+    except concurrent.futures.process.BrokenProcessPool as e:
+        logger.error("Worker process died while converting %s: %s", pdf_path.name, e)
+        return ConversionResult(
+            pdf_path=pdf_path, status="failed", error_message=f"Worker process died: {e}"
+        )
+    except Exception as e:
+        logger.error("Failed to convert: %s - %s", pdf_path.name, e)
+        return ConversionResult(pdf_path=pdf_path, status="failed", error_message=str(e))
+
+
 def convert_batch(settings: Settings) -> BatchResult:
     """Convert all PDFs in input folder.
 
@@ -240,29 +471,71 @@ def convert_batch(settings: Settings) -> BatchResult:
 
     # Validate input folder
     if not settings.input_folder.exists():
-        logger.error(f"Input folder not found: {settings.input_folder}")
+        logger.error("Input folder not found: %s", settings.input_folder)
         return batch_result
 
     # Create output folder if needed
     settings.output_folder.mkdir(parents=True, exist_ok=True)
 
-    # Find all PDF files
-    pdf_files = sorted(settings.input_folder.glob("*.pdf"))
+    # One scan of the output folder replaces a stat per PDF and per page
+    existing = list_existing_outputs(settings.output_folder)
 
-    if not pdf_files:
-        logger.warning(f"No PDF files found in: {settings.input_folder}")
-        return batch_result
-
-    logger.info(f"Found {len(pdf_files)} PDF file(s)")
-
-    for pdf_path in pdf_files:
-        result = convert_pdf(pdf_path, settings)
-        batch_result.add(result)
+    # Worker log records are handled by the parent's loggers
+    log_queue: multiprocessing.Queue = multiprocessing.Queue()
+    listener = _LoggerDispatchListener(log_queue)
+    listener.start()
 
-        # Check fail_fast
-        if settings.fail_fast and result.status == "failed":
-            logger.error("fail_fast enabled. Stopping.")
-            break
+    try:
+        # Each PDF is an independent CPU-bound job, so convert them in parallel.
+        # PDFs are submitted while the folder is still being scanned.
+        # None lets the executor choose (CPU count, capped at 61 on Windows)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=settings.workers or None,
+            initializer=_init_worker,
+            initargs=(log_queue, _worker_log_level()),
+        ) as executor:
+            # Skipped PDFs are decided here and never reach the pool; workers
+            # only get their own PDF's output names, not the whole folder.
+            outputs_by_stem = group_outputs_by_stem(existing)
+            futures: dict[concurrent.futures.Future, Path] = {}
+            found = 0
+            for pdf_path in iter_pdf_files(settings.input_folder):
+                found += 1
+                if should_skip_pdf(pdf_path, settings, existing):
+                    batch_result.add(ConversionResult(pdf_path=pdf_path, status="skipped"))
+                    continue
+                own_outputs = outputs_by_stem.get(pdf_path.stem, frozenset())
+                future = executor.submit(convert_pdf, pdf_path, settings, own_outputs)
+                futures[future] = pdf_path
+
+            if not found:
+                logger.warning("No PDF files found in: %s", settings.input_folder)
+                return batch_result
+
+            logger.info("Found %d PDF file(s)", found)
+
+            collected: set[concurrent.futures.Future] = set()
+            for future in concurrent.futures.as_completed(futures):
+                result = _future_result(future, futures[future])
+                batch_result.add(result)
+                collected.add(future)
+
+                # Check fail_fast
+                if settings.fail_fast and result.status == "failed":
+                    logger.error("fail_fast enabled. Stopping.")
+                    # Waits for conversions that already started
+                    executor.shutdown(cancel_futures=True)
+                    break
+
+            # PDFs that were already running when fail_fast hit still wrote output
+            for future, pdf_path in futures.items():
+                if future not in collected and not future.cancelled():
+                    batch_result.add(_future_result(future, pdf_path))
+    finally:
+        listener.stop()
+
+    # Results arrive in completion order; sort for a deterministic summary
+    batch_result.results.sort(key=lambda r: r.pdf_path.name)
 
     return batch_result
 
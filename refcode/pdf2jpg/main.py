@@ -6,6 +6,7 @@ Usage:
 """
 
 import logging
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -54,9 +55,9 @@ def main() -> int:
     logger.info("=" * 50)
     logger.info("PDF to JPG Converter v1.0.0")
     logger.info("=" * 50)
-    logger.info(f"Input:  {settings.input_folder.resolve()}")
-    logger.info(f"Output: {settings.output_folder.resolve()}")
-    logger.info(f"DPI: {settings.dpi}, Quality: {settings.jpg_quality}")
+    logger.info("Input:  %s", settings.input_folder.resolve())
+    logger.info("Output: %s", settings.output_folder.resolve())
+    logger.info("DPI: %s, Quality: %s", settings.dpi, settings.jpg_quality)
     logger.info("=" * 50)
 
     # Run conversion
@@ -72,4 +73,6 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Required for the process pool in frozen (PyInstaller) Windows builds
+    multiprocessing.freeze_support()
     sys.exit(main())
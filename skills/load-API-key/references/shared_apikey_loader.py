@@ -19,8 +19,16 @@ shared_apikey_loader.py
 
 import os
 import configparser
+import functools
+import stat
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
+
+# list_keys()에서 마스킹 없이 보여줄 앞자리 수
+_MASK_VISIBLE = 8
+
+# 마지막으로 로드한 .env의 (경로, 수정시각). 같으면 load_shared_keys()가 재로드를 건너뛴다.
+_loaded_env: tuple[str, int] | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -31,25 +39,57 @@ def _get_settings_path() -> Path:
     return Path(__file__).parent / "settings.ini"
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_settings_cached(path_str: str, mtime_ns: int) -> configparser.ConfigParser:
+    """settings.ini를 파싱한다. (경로, 수정시각) 기준으로 캐시되므로 파일이 바뀌면 다시 읽는다."""
+    config = configparser.ConfigParser()
+    config.read(path_str, encoding="utf-8")
+    return config
+
+
 def _read_settings() -> configparser.ConfigParser:
-    """settings.ini를 읽어 ConfigParser 객체로 반환한다."""
+    """settings.ini를 읽어 ConfigParser 객체로 반환한다. (캐시 공유 객체이므로 읽기 전용)"""
     settings_path = _get_settings_path()
     if not settings_path.exists():
         raise FileNotFoundError(
             f"설정 파일을 찾을 수 없습니다: {settings_path}\n"
             f"settings.ini 파일을 생성한 뒤 공용서버 경로를 입력하세요."
         )
-    config = configparser.ConfigParser()
-    config.read(str(settings_path), encoding="utf-8")
-    return config
+    return _parse_settings_cached(str(settings_path), settings_path.stat().st_mtime_ns)
 
 
 # ---------------------------------------------------------------------------
 # 키 로드
 # ---------------------------------------------------------------------------
+def _stat_file(path: str) -> os.stat_result | None:
+    """일반 파일이면 stat 결과를, 없거나 접근 불가면 None을 반환한다. (네트워크 경로 stat 1회)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def _load_env_once(path: str, st: os.stat_result, encoding: str) -> bool:
+    """.env를 로드한다. 같은 파일이 바뀌지 않았으면 다시 파싱하지 않는다.
+
+    Returns:
+        True  - 새로 로드함
+        False - 이미 로드된 상태라 건너뜀
+    """
+    global _loaded_env
+    key = (path, st.st_mtime_ns)
+    if _loaded_env == key:
+        return False
+    load_dotenv(dotenv_path=path, encoding=encoding, override=True)
+    _loaded_env = key
+    return True
+
+
 def load_shared_keys() -> bool:
     """
     settings.ini에 지정된 공용서버 .env 파일을 읽어 환경변수로 로드한다.
+    같은 프로세스에서 반복 호출하면 .env가 바뀐 경우에만 다시 로드한다.
 
     Returns:
         True  - 공용서버 .env 로드 성공
@@ -63,9 +103,10 @@ def load_shared_keys() -> bool:
     local_env = config.get("options", "local_env_path", fallback=".env")
 
     # 1) 공용서버 경로 시도
-    if env_path and Path(env_path).is_file():
-        load_dotenv(dotenv_path=env_path, encoding=encoding, override=True)
-        print(f"[INFO] 공용서버 .env 로드 완료: {env_path}")
+    st = _stat_file(env_path) if env_path else None
+    if st is not None:
+        if _load_env_once(env_path, st, encoding):
+            print(f"[INFO] 공용서버 .env 로드 완료: {env_path}")
         return True
 
     print(f"[WARN] 공용서버 .env 접근 불가: {env_path}")
@@ -73,9 +114,10 @@ def load_shared_keys() -> bool:
     # 2) 로컬 폴백
     if use_fallback:
         local_path = Path(local_env) if Path(local_env).is_absolute() else Path.cwd() / local_env
-        if local_path.is_file():
-            load_dotenv(dotenv_path=str(local_path), encoding=encoding, override=True)
-            print(f"[INFO] 로컬 폴백 .env 로드 완료: {local_path}")
+        st = _stat_file(str(local_path))
+        if st is not None:
+            if _load_env_once(str(local_path), st, encoding):
+                print(f"[INFO] 로컬 폴백 .env 로드 완료: {local_path}")
             return False
 
     print("[ERROR] 사용 가능한 .env 파일이 없습니다.")
@@ -99,6 +141,12 @@ def get_key(key_name: str, default: str | None = None) -> str | None:
     return value
 
 
+@functools.lru_cache(maxsize=4)
+def _env_key_names_cached(path_str: str, mtime_ns: int) -> tuple[str, ...]:
+    """.env 파일의 키 이름 목록을 파싱한다. (경로, 수정시각) 기준으로 캐시된다."""
+    return tuple(dotenv_values(path_str, encoding="utf-8"))
+
+
 def list_keys() -> dict[str, str]:
     """
     현재 로드된 API 키 목록을 반환한다.
@@ -110,17 +158,12 @@ def list_keys() -> dict[str, str]:
     keys = {}
     # .env 파일을 직접 파싱하여 키 이름 목록 확보
     for path in [env_path, config.get("options", "local_env_path", fallback=".env")]:
-        p = Path(path)
-        if p.is_file():
-            with open(p, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        name = line.split("=", 1)[0].strip()
-                        val = os.getenv(name, "")
-                        if val:
-                            masked = val[:8] + "*" * max(0, len(val) - 8)
-                            keys[name] = masked
+        st = _stat_file(path) if path else None
+        if st is not None:
+            for name in _env_key_names_cached(path, st.st_mtime_ns):
+                val = os.getenv(name, "")
+                if val:
+                    keys[name] = val[:_MASK_VISIBLE] + "*" * max(0, len(val) - _MASK_VISIBLE)
             break
     return keys
 